@@ -18,6 +18,7 @@ LAST_YEAR: str = str(datetime.now().year - 1)
 # Processing
 BATCH_SIZE: int = 100
 MAX_CONNECTIONS: int = 5
+IO_WORKERS: int = 8
 QUERY_TIMEOUT: int = 60
 MAX_RETRIES: int = 3
 
@@ -30,6 +31,9 @@ CREDENTIAL_FILE = os.path.expanduser(CREDENTIAL_FILE)
 HOST: str = os.getenv("DB_HOST", "analytics.db.svc.wikimedia.cloud")
 DATABASE_PORT: int = int(os.getenv("DB_PORT", 3306))
 
+# Seconds before the saved meta_p database mapping is refreshed
+DB_MAPPING_TTL: int = int(os.getenv("DB_MAPPING_TTL", 7 * 24 * 3600))
+
 STATUS_DATA_DIR = os.getenv("STATUS_DATA_DIR", "~/data")
 STATUS_DATA_DIR = Path(STATUS_DATA_DIR).expanduser()
 
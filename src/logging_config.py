@@ -1,18 +1,164 @@
 """
 Logging configuration with colored output.
+
+Records are handed to a background ``QueueListener`` thread which owns the
+console and file handlers, so logging calls on the workflow thread only
+enqueue the record instead of blocking on stdout/file writes.
 """
 
+import atexit
+import functools
 import logging
+import logging.handlers
+import queue
 import sys
-from typing import Optional
+import threading
+from pathlib import Path
+from typing import Optional, Set
 
 import colorlog
 
+# Number of records buffered before the log file is written
+FILE_BUFFER_CAPACITY = 512
+# Seconds between periodic flushes of a partially filled file buffer
+FILE_FLUSH_INTERVAL = 5.0
+
+CONSOLE_FORMAT = "%(log_color)s%(asctime)s - %(name)s - %(levelname)-8s%(reset)s %(message)s"
+FILE_FORMAT = "%(asctime)s - %(name)s - %(levelname)-8s - %(message)s"
+
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
+# Log directories already created by this process
+_PREPARED_LOG_DIRS: Set[Path] = set()
+
+# Silence noisy third-party loggers
+logging.getLogger("urllib3").setLevel(logging.WARNING)
+logging.getLogger("pymysql").setLevel(logging.WARNING)
+
+
+def stop_logging() -> None:
+    """
+    Stop the background log listener and close its handlers.
+
+    Pending records are flushed before the listener thread exits. Safe to
+    call when logging was never configured.
+    """
+    global _listener, _queue_handler
+
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            target = getattr(handler, "target", None)
+            handler.close()
+            if target is not None:
+                target.close()
+        _listener = None
+
+
+atexit.register(stop_logging)
+
+
+class TimedMemoryHandler(logging.handlers.MemoryHandler):
+    """
+    MemoryHandler that also flushes its buffer every ``flush_interval`` seconds.
+
+    Keeps the log file current during long quiet stretches (e.g. a single
+    slow query) and bounds what is lost if the process is killed.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        flush_interval: float,
+        flushLevel: int = logging.ERROR,
+        target: Optional[logging.Handler] = None,
+        flushOnClose: bool = True,
+    ) -> None:
+        super().__init__(capacity, flushLevel=flushLevel, target=target, flushOnClose=flushOnClose)
+        self.flush_interval = flush_interval
+        self._stop_event = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, name="log-file-flusher", daemon=True)
+        self._flusher.start()
+
+    def _flush_periodically(self) -> None:
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()
+
+    def close(self) -> None:
+        self._stop_event.set()
+        super().close()
+
+
+def prepare_log_file(log_file: str) -> Path:
+    """
+    Expand the log file path and make sure its directory exists.
+
+    Each directory is created at most once per process.
+
+    Args:
+        log_file: File path for log output (may start with ``~``)
+
+    Returns:
+        Expanded log file path
+    """
+    path = Path(log_file).expanduser()
+    parent = path.parent
+
+    if parent not in _PREPARED_LOG_DIRS:
+        parent.mkdir(parents=True, exist_ok=True)
+        _PREPARED_LOG_DIRS.add(parent)
+
+    return path
+
+
+def setup_file_handler(log_file: str, level: int) -> logging.Handler:
+    """
+    Build a buffered file handler (no colors).
+
+    Records are kept in memory and written in batches of
+    ``FILE_BUFFER_CAPACITY``; ERROR and above flush immediately, a partial
+    batch is flushed every ``FILE_FLUSH_INTERVAL`` seconds and again when
+    the handler is closed.
+
+    Args:
+        log_file: File path for log output
+        level: Numeric logging level
+
+    Returns:
+        TimedMemoryHandler wrapping a FileHandler
+    """
+    file_formatter = logging.Formatter(
+        fmt=FILE_FORMAT,
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    file_handler = logging.FileHandler(prepare_log_file(log_file), mode="a", encoding="utf-8")
+    file_handler.setFormatter(file_formatter)
+    file_handler.setLevel(level)
+
+    buffered_handler = TimedMemoryHandler(
+        capacity=FILE_BUFFER_CAPACITY,
+        flush_interval=FILE_FLUSH_INTERVAL,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True,
+    )
+    buffered_handler.setLevel(level)
+    return buffered_handler
+
 
 def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
     """
     Configure colored logging for console and optional file output.
 
+    Calling this again replaces the previous configuration instead of
+    stacking another set of handlers.
+
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional file path for log output
@@ -20,12 +166,16 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
     Example:
         >>> setup_logging(level="DEBUG", log_file="app.log")
     """
+    global _listener, _queue_handler
+
+    stop_logging()
+
     # Convert string level to logging constant
     numeric_level = getattr(logging, level.upper(), logging.INFO)
 
     # Create color formatter for console
     console_formatter = colorlog.ColoredFormatter(
-        fmt="%(log_color)s%(asctime)s - %(name)s - %(levelname)-8s%(reset)s %(message)s",
+        fmt=CONSOLE_FORMAT,
         datefmt="%Y-%m-%d %H:%M:%S",
         log_colors={
             "DEBUG": "cyan",
@@ -42,28 +192,23 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(console_formatter)
     console_handler.setLevel(numeric_level)
+    handlers = [console_handler]
+
+    # Optional buffered file handler
+    if log_file:
+        handlers.append(setup_file_handler(log_file, numeric_level))
 
-    # Root logger configuration
+    # Root logger only enqueues records; the listener thread does the I/O
+    _queue_handler = logging.handlers.QueueHandler(_log_queue)
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
-    root_logger.addHandler(console_handler)
-
-    # Optional file handler (no colors)
-    if log_file:
-        file_formatter = logging.Formatter(
-            fmt="%(asctime)s - %(name)s - %(levelname)-8s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        file_handler = logging.FileHandler(log_file, mode="a", encoding="utf-8")
-        file_handler.setFormatter(file_formatter)
-        file_handler.setLevel(numeric_level)
-        root_logger.addHandler(file_handler)
+    root_logger.addHandler(_queue_handler)
 
-    # Silence noisy third-party loggers
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
-    logging.getLogger("pymysql").setLevel(logging.WARNING)
+    _listener = logging.handlers.QueueListener(_log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
 
 
+@functools.lru_cache(maxsize=256)
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a module.
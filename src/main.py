@@ -7,20 +7,20 @@ workflow for analyzing editor contributions across Wikipedia Medicine projects.
 
 import argparse
 import sys
+from typing import List, Optional
 
 from .config import LAST_YEAR, LOG_LEVEL
 from .logging_config import get_logger, setup_logging
-from .workflow import WorkflowOrchestrator
 
 logger = get_logger(__name__)
 
 
-def parse_arguments() -> argparse.Namespace:
+def _build_parser() -> argparse.ArgumentParser:
     """
-    Parse command-line arguments.
+    Build the command-line argument parser.
 
     Returns:
-        Parsed arguments namespace
+        Configured argument parser
     """
     parser = argparse.ArgumentParser(
         description="Wikipedia Medicine Editor Analysis Tool",
@@ -81,7 +81,23 @@ def parse_arguments() -> argparse.Namespace:
         help="Skip processing languages that have existing data in step 2",
     )
 
-    return parser.parse_args()
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+
+    Args:
+        argv: Optional argument list (default: sys.argv[1:])
+
+    Returns:
+        Parsed arguments namespace
+    """
+    return _PARSER.parse_args(argv)
 
 
 def main() -> int:
@@ -91,6 +107,9 @@ def main() -> int:
     Returns:
         Exit code (0 for success, 1 for failure)
     """
+    # Imported here so argument parsing does not load the workflow and database stack
+    from .workflow import WorkflowOrchestrator  # pylint: disable=import-outside-toplevel
+
     # Parse arguments
     args = parse_arguments()
 
@@ -9,7 +9,7 @@ See .claude/context/architecture.md for design details.
 
 import os
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 import pymysql
 import pymysql.cursors
@@ -76,7 +76,7 @@ class DatabaseUtils:
         Recursively convert bytes in data structures to strings.
 
         Args:
-            data: Input data (could be dict, list, bytes, or other types)
+            data: Input data (could be dict, list, tuple, bytes, or other types)
 
         Returns:
             The input data with all byte strings converted to regular strings
@@ -85,6 +85,8 @@ class DatabaseUtils:
             return {self.resolve_bytes(key): self.resolve_bytes(value) for key, value in data.items()}
         elif isinstance(data, list):
             return [self.resolve_bytes(item) for item in data]
+        elif isinstance(data, tuple):
+            return tuple(self.resolve_bytes(item) for item in data)
         elif isinstance(data, bytes):
             return data.decode("utf-8", errors="replace")
         return data
@@ -213,7 +215,7 @@ class Database(DatabaseUtils):
                 if self.timeout is not None:
                     connect_params["connect_timeout"] = self.timeout
 
-                logger.info(f"Connecting to database {self.database} at host {self.host}:{self.port}")
+                logger.info("Connecting to database %s at host %s:%s", self.database, self.host, self.port)
 
                 self.connection = pymysql.connect(
                     host=self.host,
@@ -244,16 +246,26 @@ class Database(DatabaseUtils):
                     logger.error("Failed to connect after %d attempts", MAX_RETRIES)
                     raise
 
-    def execute(self, query: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    def execute(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+        as_dict: bool = True,
+    ) -> Union[List[Any], Iterator[Any]]:
         """
         Execute a SQL query and return results.
 
         Args:
             query: SQL query to execute
             params: Optional query parameters
+            stream: If True, read rows through a server-side cursor and
+                yield them one at a time instead of buffering the result
+            as_dict: If False, return rows as tuples in SELECT column order
 
         Returns:
-            List of result rows as dictionaries
+            List of result rows (dictionaries, or tuples when ``as_dict`` is
+            False), or an iterator over them when ``stream`` is True
 
         Raises:
             pymysql.err.ProgrammingError: If query has syntax errors
@@ -265,8 +277,13 @@ class Database(DatabaseUtils):
         if not self.connection:
             raise RuntimeError("Database connection not established")
 
+        if stream:
+            return self._execute_stream(query, params, as_dict=as_dict)
+
+        cursor_class = pymysql.cursors.DictCursor if as_dict else pymysql.cursors.Cursor
+
         try:
-            with self.connection.cursor() as cursor:
+            with self.connection.cursor(cursor_class) as cursor:
                 logger.debug("Executing query: %s...", query[:100])
                 cursor.execute(query, params)
                 results = cursor.fetchall()
@@ -280,3 +297,39 @@ class Database(DatabaseUtils):
         except pymysql.err.OperationalError as e:
             logger.error("Query execution error: %s", str(e))
             raise
+
+    def _execute_stream(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        as_dict: bool = True,
+    ) -> Iterator[Any]:
+        """
+        Execute a SQL query on a server-side cursor and yield rows.
+
+        The iterator must be consumed before the next query on this connection.
+
+        Args:
+            query: SQL query to execute
+            params: Optional query parameters
+            as_dict: If False, yield rows as tuples in SELECT column order
+
+        Yields:
+            Result rows as dictionaries (or tuples)
+        """
+        cursor_class = pymysql.cursors.SSDictCursor if as_dict else pymysql.cursors.SSCursor
+
+        try:
+            with self.connection.cursor(cursor_class) as cursor:
+                logger.debug("Executing streamed query: %s...", query[:100])
+                cursor.execute(query, params)
+                for row in cursor:
+                    yield self.resolve_bytes(row)
+
+        except pymysql.err.ProgrammingError as e:
+            logger.error("Query syntax error: %s\nQuery: %s", str(e), query[:200])
+            raise
+
+        except pymysql.err.OperationalError as e:
+            logger.error("Query execution error: %s", str(e))
+            raise
@@ -2,10 +2,14 @@
 
 import functools
 import json
+import threading
+import time
 from pathlib import Path
 from typing import Dict
 
-from ..config import OUTPUT_DIRS
+import pymysql
+
+from ..config import DB_MAPPING_TTL, OUTPUT_DIRS
 from ..logging_config import get_logger
 from .database import Database
 from .queries import QueryBuilder
@@ -14,6 +18,8 @@ logger = get_logger(__name__)
 
 query_builder = QueryBuilder()
 
+_mapping_lock = threading.Lock()
+
 
 def save_db_mapping(mapping_list: Dict[str, str]) -> None:
     """
@@ -46,6 +52,21 @@ def load_db_mapping() -> Dict[str, str]:
     return mapping
 
 
+def is_db_mapping_fresh() -> bool:
+    """
+    Check whether the saved database mapping is younger than DB_MAPPING_TTL.
+
+    Returns:
+        True if the mapping file exists and has not expired
+    """
+    input_file = Path(OUTPUT_DIRS["sqlresults"]) / "db_mapping.json"
+
+    if not input_file.exists():
+        return False
+
+    return time.time() - input_file.stat().st_mtime < DB_MAPPING_TTL
+
+
 def fetch_database_mapping() -> Dict[str, str]:
     """
     Get mapping of language codes to database names from meta database.
@@ -65,19 +86,14 @@ def fetch_database_mapping() -> Dict[str, str]:
     query = query_builder.get_database_mapping()
 
     with Database("s7.analytics.db.svc.wikimedia.cloud", "meta_p") as db:
-        results = db.execute(query)
-
-        for row in results:
-            url = row.get("url", "")
-            lang = row.get("lang", "")
-            dbname = row.get("dbname", "")
-            url_lang = url.split(".")[0].replace("https://", "")
-
+        # Tuple rows follow the SELECT order: lang, dbname, url
+        for lang, dbname, url in db.execute(query, stream=True, as_dict=False):
             if not dbname:
                 continue
             if lang:
                 mapping[lang] = dbname
             if url:
+                url_lang = url.split(".")[0].replace("https://", "")
                 mapping[url_lang] = dbname
 
         logger.info("✓ Retrieved mappings for %d languages", len(mapping))
@@ -85,11 +101,40 @@ def fetch_database_mapping() -> Dict[str, str]:
     return mapping
 
 
+def refresh_database_mapping() -> Dict[str, str]:
+    """
+    Fetch mappings from meta_p and save them, falling back to the saved copy.
+
+    Returns:
+        Dictionary mapping language codes to database names
+
+    Raises:
+        pymysql.err.Error, OSError, ValueError: If fetching fails and no
+            saved mapping exists
+    """
+    try:
+        mapping = fetch_database_mapping()
+    except (pymysql.err.Error, OSError, ValueError) as e:
+        mapping = load_db_mapping()
+        if not mapping:
+            raise
+        logger.warning("Failed to refresh database mappings, using saved copy: %s", str(e))
+        return mapping
+
+    if mapping:
+        save_db_mapping(mapping)
+
+    return mapping
+
+
 @functools.lru_cache(maxsize=1)
 def get_database_mapping() -> Dict[str, str]:
     """
     Get mapping of language codes to database names from meta_p.
 
+    The saved mapping file is reused until it is older than DB_MAPPING_TTL;
+    the result is cached for the rest of the process (see ``cache_clear``).
+
     Returns:
         Dictionary mapping language codes to database names
 
@@ -98,15 +143,15 @@ def get_database_mapping() -> Dict[str, str]:
         >>> mapping = orchestrator.get_database_mapping()
         >>> # Returns: {"en": "enwiki", "fr": "frwiki", ...}
     """
-
-    mapping: Dict[str, str] = load_db_mapping()
-    if not mapping:
-        mapping = fetch_database_mapping()
+    # Language workers may race on the first lookup; only one should hit meta_p
+    with _mapping_lock:
+        mapping: Dict[str, str] = load_db_mapping() if is_db_mapping_fresh() else {}
+        if not mapping:
+            mapping = refresh_database_mapping()
 
     if mapping:
         # Ensure English value to avoid ("en", "testwiki", "https://test.wikipedia.org") entry
         mapping["en"] = "enwiki"
-        save_db_mapping(mapping)
 
     return mapping
 
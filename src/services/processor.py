@@ -5,7 +5,10 @@ This module provides the EditorProcessor class for processing and
 aggregating editor statistics from Wikipedia databases.
 """
 
-from typing import Any, Dict, List
+import logging
+import threading
+from concurrent.futures import CancelledError
+from typing import Any, Dict, Iterable, List, Optional
 
 from ..logging_config import get_logger
 from ..utils import is_ip_address
@@ -28,17 +31,25 @@ class EditorProcessor:
         self.query_builder = QueryBuilder()
         logger.debug("EditorProcessor initialized")
 
-    def _aggregate_results(self, results: List[Dict[str, Any]]) -> Dict[str, int]:
+    def _aggregate_results(
+        self,
+        results: Iterable[Dict[str, Any]],
+        editors: Optional[Dict[str, int]] = None,
+    ) -> Dict[str, int]:
         """
         Aggregate editor counts from query results.
 
         Args:
-            results: List of query results with actor_name and count
+            results: Query result rows with actor_name and count (list or stream)
+            editors: Optional dictionary to accumulate into instead of a new one
 
         Returns:
             Dictionary mapping usernames to edit counts
         """
-        editors = {}
+        if editors is None:
+            editors = {}
+
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
         for row in results:
             actor_name = row.get("actor_name", "")
@@ -46,12 +57,14 @@ class EditorProcessor:
 
             # Filter out IP addresses
             if is_ip_address(actor_name):
-                logger.debug("Skipped IP address: %s", actor_name)
+                if debug_enabled:
+                    logger.debug("Skipped IP address: %s", actor_name)
                 continue
 
             # Filter out bot accounts (additional check)
             if "bot" in actor_name.lower():
-                logger.debug("Skipped bot account: %s", actor_name)
+                if debug_enabled:
+                    logger.debug("Skipped bot account: %s", actor_name)
                 continue
 
             editors[actor_name] = editors.get(actor_name, 0) + count
@@ -106,6 +119,8 @@ class EditorProcessor:
         titles: List[str],
         year: str,
         batch_size: int = 100,
+        *,
+        cancel_event: Optional[threading.Event] = None,
     ) -> Dict[str, int]:
         """
         Process editor statistics for a specific language.
@@ -114,10 +129,15 @@ class EditorProcessor:
             lang: Language code (e.g., "en", "ar", "fr")
             titles: List of article titles in this language
             year: Year to filter (e.g., "2024")
+            cancel_event: Optional event checked before each batch; when set,
+                the remaining batches are skipped
 
         Returns:
             Dictionary mapping editor names to edit counts
 
+        Raises:
+            CancelledError: If ``cancel_event`` is set before all batches ran
+
         Example:
             >>> processor = EditorProcessor()
             >>> editors = processor.process_language_patch("en", ["Medicine"], "2024", 100)
@@ -130,20 +150,23 @@ class EditorProcessor:
 
         with DatabaseAnalytics(lang) as db:
             batches = self._batch_titles(titles, batch_size)
+            total_batches = len(batches)
+            info_enabled = logger.isEnabledFor(logging.INFO)
+
             for batch_num, batch in enumerate(batches, 1):
-                logger.info("Processing batch %d/%d", batch_num, len(batches))
+                if cancel_event is not None and cancel_event.is_set():
+                    raise CancelledError(f"Processing of {lang} cancelled before batch {batch_num}/{total_batches}")
+                if info_enabled:
+                    logger.info("[%s] Processing batch %d/%d", lang, batch_num, total_batches)
                 query, params = self.query_builder.get_editors_standard(batch, year)
 
                 try:
-                    results = db.execute(query, params=params)
+                    # Stream rows straight into the running totals, no per-batch dict
+                    self._aggregate_results(db.execute(query, params=params, stream=True), editors)
                 except Exception as e:
                     logger.error("Failed to process language %s: %s", lang, str(e), exc_info=True)
                     raise
 
-                editors_patch = self._aggregate_results(results)
-                for editor, count in editors_patch.items():
-                    editors[editor] = editors.get(editor, 0) + count
-
         return editors
 
     def process_language(self, lang: str, titles: List[str], year: str, batch_size: int = 100) -> Dict[str, int]:
@@ -2,11 +2,14 @@
 Step 1: Retrieve medicine titles
 """
 
-from typing import Any, Dict, List
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from typing import Any, DefaultDict, Dict, List
 
 from tqdm import tqdm
 
-from ..config import OUTPUT_DIRS
+from ..config import IO_WORKERS, OUTPUT_DIRS
 from ..logging_config import get_logger
 from ..services import DatabaseAnalytics, QueryBuilder
 from ..utils import save_language_titles, save_titles_sql_results
@@ -15,21 +18,23 @@ logger = get_logger(__name__)
 
 
 def _organize_titles_by_language(results: List[Dict]) -> Dict[str, List[str]]:
-    en_titles = set()
-    titles_by_language = {"en": []}
+    # dict keys give an order-preserving de-duplication of the English titles
+    en_titles: Dict[str, None] = {}
+    titles_by_language: DefaultDict[str, List[str]] = defaultdict(list, {"en": []})
 
     for x in tqdm(results, desc="Organizing titles by language", unit="rows"):
-        lang = x.get("ll_lang", "")
-        title = x.get("ll_title", "")
+        page_title = x.get("page_title")
+        if page_title:
+            en_titles[page_title] = None
 
+        lang = x.get("ll_lang")
+        title = x.get("ll_title")
         if lang and title:
-            titles_by_language.setdefault(lang, []).append(title)
-
-        en_titles.add(x.get("page_title", ""))
+            titles_by_language[lang].append(title)
 
     titles_by_language["en"] = list(en_titles)
 
-    return titles_by_language
+    return dict(titles_by_language)
 
 
 def _save_language_summary_report(titles_by_language: Dict[str, List[str]]) -> None:
@@ -40,21 +45,30 @@ def _save_language_summary_report(titles_by_language: Dict[str, List[str]]) -> N
     data = dict(sorted(data.items(), key=lambda item: item[1], reverse=True))
     output_file = OUTPUT_DIRS["reports"] / "language_titles_summary.wiki"
 
-    wiki_text = "Language Titles Summary:\n"
-    wiki_text += '{| class="wikitable"\n! Language !! Number of Titles\n'
-    for lang, count in data.items():
-        wiki_text += f"|-\n| [https://{lang}.wikipedia.org/wiki/ {lang}] || {count}\n"
-    wiki_text += "|}\n"
+    lines = ["Language Titles Summary:\n", '{| class="wikitable"\n! Language !! Number of Titles\n']
+    lines.extend(f"|-\n| [https://{lang}.wikipedia.org/wiki/ {lang}] || {count}\n" for lang, count in data.items())
+    lines.append("|}\n")
 
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(wiki_text)
+    output_file.write_text("".join(lines), encoding="utf-8")
     logger.info(" ✓ Saved language titles summary report to %s", output_file.name)
 
 
 def _save_language_files(titles_by_language: Dict[str, List[str]]) -> None:
     """Save title lists to language files."""
-    for lang, titles in titles_by_language.items():
-        save_language_titles(lang, titles, OUTPUT_DIRS["languages"])
+    if not titles_by_language:
+        return
+
+    max_workers = min(IO_WORKERS, len(titles_by_language))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # list() drains the results so the first failed write is re-raised here
+        list(
+            executor.map(
+                save_language_titles,
+                titles_by_language.keys(),
+                titles_by_language.values(),
+                repeat(OUTPUT_DIRS["languages"]),
+            )
+        )
 
 
 def fetch_medicine_titles() -> List[Dict[str, Any]]:
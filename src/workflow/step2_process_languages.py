@@ -2,29 +2,36 @@
 Step 2: Process languages
 """
 
+import logging
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from typing import Dict, List, Optional
 
 from tqdm import tqdm
 
-from ..config import BATCH_SIZE, OUTPUT_DIRS
+from ..config import BATCH_SIZE, MAX_CONNECTIONS, OUTPUT_DIRS
 from ..logging_config import get_logger
 from ..services import EditorProcessor, QueryBuilder, ReportGenerator
-from ..utils import get_available_languages, load_language_titles_safe
+from ..utils import format_number, get_available_languages, load_language_titles_safe
 
 logger = get_logger(__name__)
 
 processor = EditorProcessor()
 query_builder = QueryBuilder()
 
+_SEP = "=" * 60
+_DASH = "-" * 60
+
 
 def _get_languages_to_process(languages: Optional[List[str]]) -> List[str]:
     """Determine which languages to process."""
     available_languages = get_available_languages(OUTPUT_DIRS["languages"])
 
     if languages:
-        languages_to_process = [lang for lang in languages if lang in available_languages]
+        available_set = set(available_languages)
+        languages_to_process = [lang for lang in languages if lang in available_set]
         if len(languages_to_process) < len(languages):
-            missing = set(languages) - set(languages_to_process)
+            missing = set(languages) - available_set
             logger.warning("Requested languages not found: %s", missing)
         return languages_to_process
     else:
@@ -36,36 +43,58 @@ def _process_single_language(
     year: str,
     batch_size: int,
     titles: List[str],
+    *,
+    cancel_event: Optional[threading.Event] = None,
 ) -> Dict[str, int]:
     """Process a single language."""
     report_generator = ReportGenerator()
-    editors = _process_titles_for_language(lang, titles, year, batch_size)
+    editors = _process_titles_for_language(lang, titles, year, batch_size, cancel_event=cancel_event)
 
     if editors:
         report_generator.save_editors_json(lang, editors)
         report_generator.generate_language_report(lang, editors, year)
 
-    logger.info(
-        "✓ Language '%s' complete: %d editors, %d edits",
-        lang,
-        len(editors),
-        sum(editors.values()),
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "✓ Language '%s' complete: %d editors, %d edits",
+            lang,
+            len(editors),
+            sum(editors.values()),
+        )
     return editors
 
 
+def _process_language_task(
+    lang: str,
+    year: str,
+    batch_size: int,
+    titles: List[str],
+    *,
+    position: int,
+    total: int,
+    cancel_event: Optional[threading.Event] = None,
+) -> Dict[str, int]:
+    """Log the language banner and process it (runs in a worker thread)."""
+    logger.info(_DASH)
+    logger.info("Language %d/%d: %s, titles: %s", position, total, lang, format_number(len(titles)))
+    logger.info(_DASH)
+    return _process_single_language(lang, year, batch_size, titles, cancel_event=cancel_event)
+
+
 def _process_titles_for_language(
     lang: str,
     titles: List[str],
     year: str,
     batch_size: int,
+    *,
+    cancel_event: Optional[threading.Event] = None,
 ) -> Dict[str, int]:
     """Process titles for a language, with batching if needed."""
 
     if lang in ["ar", "en"]:
         return processor.process_language_ar_en(lang, year)
 
-    return processor.process_language_patch(lang, titles, year, batch_size)
+    return processor.process_language_patch(lang, titles, year, batch_size, cancel_event=cancel_event)
 
 
 def gather_language_titles(languages_to_process: List[str], sort_descending: bool = False) -> dict[str, list[str]]:
@@ -94,6 +123,63 @@ def gather_language_titles(languages_to_process: List[str], sort_descending: boo
     return languages_titles
 
 
+def _process_languages_concurrently(
+    languages_titles: Dict[str, List[str]],
+    year: str,
+    batch_size: int,
+) -> Dict[str, Dict[str, int]]:
+    """
+    Process languages on a thread pool bounded by MAX_CONNECTIONS.
+
+    The first failure (or KeyboardInterrupt) drops queued languages and tells
+    running ones to stop before their next batch, then re-raises. A query
+    already in flight, such as the single en/ar query, still runs to
+    completion before the error surfaces.
+
+    Returns:
+        Dictionary mapping language codes to editor statistics, in
+        ``languages_titles`` order
+    """
+    total = len(languages_titles)
+    cancel_event = threading.Event()
+
+    # Languages are I/O bound; overlap them up to the database connection limit
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_CONNECTIONS, total))) as executor:
+        futures = {
+            lang: executor.submit(
+                _process_language_task,
+                lang,
+                year,
+                batch_size,
+                titles,
+                position=i,
+                total=total,
+                cancel_event=cancel_event,
+            )
+            for i, (lang, titles) in enumerate(languages_titles.items(), 1)
+        }
+
+        try:
+            # Return on the first failure rather than waiting behind earlier, slower languages
+            done, _ = wait(futures.values(), return_when=FIRST_EXCEPTION)
+            for future in done:
+                if future.exception() is not None:
+                    future.result()
+        except BaseException:
+            cancel_event.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    # Collect in submission order so results keep the requested sort order
+    all_editors: Dict[str, Dict[str, int]] = {}
+    for lang, future in futures.items():
+        lang_editors = future.result()
+        if lang_editors:
+            all_editors[lang] = lang_editors
+
+    return all_editors
+
+
 def process_languages(
     year: str,
     languages: Optional[List[str]] = None,
@@ -115,9 +201,9 @@ def process_languages(
     Example:
         >>> all_editors = orchestrator.process_languages("2024", ["en", "fr"])
     """
-    logger.info("=" * 60)
+    logger.info(_SEP)
     logger.info("Step 2: Processing editor statistics by language")
-    logger.info("=" * 60)
+    logger.info(_SEP)
 
     languages_to_process: List[str] = _get_languages_to_process(languages)
 
@@ -135,15 +221,7 @@ def process_languages(
         languages_to_process, sort_descending=sort_descending
     )
 
-    all_editors: Dict[str, Dict[str, int]] = {}
-
-    for i, (lang, titles) in enumerate(languages_titles.items(), 1):
-        logger.info("-" * 60)
-        logger.info(f"Language {i}/{len(languages_titles)}: {lang}, titles: {len(titles):,}")
-        logger.info("-" * 60)
-        lang_editors = _process_single_language(lang, year, batch_size, titles)
-        if lang_editors:
-            all_editors[lang] = lang_editors
+    all_editors: Dict[str, Dict[str, int]] = _process_languages_concurrently(languages_titles, year, batch_size)
 
     logger.info("")
     logger.info("✓ Step 2 complete: %d languages processed", len(all_editors))
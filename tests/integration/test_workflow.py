@@ -15,18 +15,18 @@ class TestWorkflow:
         """Test complete data pipeline with mocked database."""
 
         # Mock database execute method to return different results based on query
-        def mock_execute(query, params=None):
+        def mock_execute(query, params=None, **kwargs):
             if "langlinks" in query:
                 # Medicine titles query
                 return [
                     {"page_title": "Medicine", "ll_lang": "fr", "ll_title": "Médecine"},
                     {"page_title": "Medicine", "ll_lang": "en", "ll_title": "Medicine"},
                 ]
-            elif "meta_p" in str(query) or "dbname" in query or "wiki" in query:
-                # Database mapping query
+            elif not kwargs.get("as_dict", True):
+                # Database mapping query streams plain tuples
                 return [
-                    {"lang": "en", "dbname": "enwiki_p"},
-                    {"lang": "fr", "dbname": "frwiki_p"},
+                    ("en", "enwiki_p", "https://en.wikipedia.org"),
+                    ("fr", "frwiki_p", "https://fr.wikipedia.org"),
                 ]
             else:
                 # Editor statistics query
@@ -43,6 +43,7 @@ class TestWorkflow:
         mock_db_context.__exit__ = mocker.Mock(return_value=None)
 
         mocker.patch("src.services.analytics_db.Database", return_value=mock_db_context)
+        mocker.patch("src.services.db_mapping.Database", return_value=mock_db_context)
 
         # Mock file operations
         mocker.patch("src.utils.save_language_titles")
@@ -0,0 +1 @@
+"""Service unit tests package."""
@@ -59,6 +59,29 @@ class TestDatabase:
                         assert len(results) == 1
                         assert results[0]["id"] == 1
 
+    def test_execute_query_stream(self):
+        """Test streamed query execution uses a server-side cursor."""
+        with patch("os.path.exists", return_value=True):
+            with patch("builtins.open", mock_open(read_data="user=test\npassword=pass\n")):
+                with patch("src.services.database.pymysql.connect") as mock_connect:
+                    import pymysql
+
+                    mock_cursor = MagicMock()
+                    mock_cursor.__iter__.return_value = iter([{"id": 1, "name": b"test"}, {"id": 2, "name": "x"}])
+                    mock_cursor.__enter__ = Mock(return_value=mock_cursor)
+                    mock_cursor.__exit__ = Mock(return_value=False)
+
+                    mock_conn = Mock()
+                    mock_conn.cursor.return_value = mock_cursor
+                    mock_connect.return_value = mock_conn
+
+                    with Database("localhost", "test") as db:
+                        results = list(db.execute("SELECT * FROM test", stream=True))
+
+                    mock_conn.cursor.assert_called_once_with(pymysql.cursors.SSDictCursor)
+                    mock_cursor.fetchall.assert_not_called()
+                    assert results == [{"id": 1, "name": "test"}, {"id": 2, "name": "x"}]
+
 
 @pytest.mark.unit
 class TestDatabaseUtils:
@@ -132,6 +155,12 @@ class TestDatabaseUtils:
         result = db_utils.resolve_bytes([b"item1", b"item2", "regular"])
         assert result == ["item1", "item2", "regular"]
 
+    def test_resolve_bytes_with_tuple(self):
+        """Test resolve_bytes with tuple rows."""
+        db_utils = DatabaseUtils()
+        result = db_utils.resolve_bytes((b"en", "enwiki", None))
+        assert result == ("en", "enwiki", None)
+
     def test_resolve_bytes_with_nested_structure(self):
         """Test resolve_bytes with nested structure."""
         db_utils = DatabaseUtils()
@@ -5,6 +5,7 @@ import os
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
+import pymysql
 import pytest
 
 from src.services.db_mapping import (
@@ -45,10 +46,10 @@ class TestDbMapping:
         # Mock Database context manager
         mock_db = MagicMock()
         mock_db.execute.return_value = [
-            {"lang": "en", "dbname": "enwiki_p", "url": "https://en.wikipedia.org/"},
-            {"lang": "fr", "dbname": "frwiki_p", "url": "https://fr.wikipedia.org/"},
-            {"dbname": "dewiki_p", "url": "https://de.wikipedia.org/", "lang": "de"},  # Missing lang
-            {"lang": "es", "dbname": "", "url": "https://es.wikipedia.org/"},  # Missing dbname
+            ("en", "enwiki_p", "https://en.wikipedia.org/"),
+            ("fr", "frwiki_p", "https://fr.wikipedia.org/"),
+            ("", "dewiki_p", "https://de.wikipedia.org/"),  # Missing lang
+            ("es", "", "https://es.wikipedia.org/"),  # Missing dbname
         ]
 
         mock_db_context = Mock()
@@ -64,6 +65,9 @@ class TestDbMapping:
             assert "de" in mapping  # From URL
             assert "es" not in mapping  # Missing dbname
             assert mapping["en"] == "enwiki_p"
+            assert mapping["de"] == "dewiki_p"
+            mock_db.execute.assert_called_once()
+            assert mock_db.execute.call_args.kwargs == {"stream": True, "as_dict": False}
 
     def test_get_database_mapping_cached(self, tmp_path):
         """Test get_database_mapping with cached file."""
@@ -116,6 +120,80 @@ class TestDbMapping:
                 assert "en" in mapping
                 assert mapping["en"] == "enwiki"
 
+    def test_get_database_mapping_stale_file_refetches(self, tmp_path):
+        """Test get_database_mapping refreshes an expired mapping file."""
+        with patch("src.services.db_mapping.OUTPUT_DIRS", {"sqlresults": tmp_path}):
+            output_file = tmp_path / "db_mapping.json"
+            output_file.write_text(json.dumps({"fr": "old_frwiki"}), encoding="utf-8")
+            os.utime(output_file, (0, 0))
+
+            with patch("src.services.db_mapping.fetch_database_mapping", return_value={"fr": "frwiki"}) as mock_fetch:
+                get_database_mapping.cache_clear()
+
+                mapping = get_database_mapping()
+
+                mock_fetch.assert_called_once()
+                assert mapping["fr"] == "frwiki"
+                assert load_db_mapping() == {"fr": "frwiki"}
+
+    def test_get_database_mapping_fresh_file_not_rewritten(self, tmp_path):
+        """Test a fresh mapping file is used without fetching or saving."""
+        with patch("src.services.db_mapping.OUTPUT_DIRS", {"sqlresults": tmp_path}):
+            output_file = tmp_path / "db_mapping.json"
+            output_file.write_text(json.dumps({"fr": "frwiki"}), encoding="utf-8")
+
+            with patch("src.services.db_mapping.fetch_database_mapping") as mock_fetch:
+                with patch("src.services.db_mapping.save_db_mapping") as mock_save:
+                    get_database_mapping.cache_clear()
+
+                    mapping = get_database_mapping()
+
+                    mock_fetch.assert_not_called()
+                    mock_save.assert_not_called()
+                    assert mapping == {"fr": "frwiki", "en": "enwiki"}
+
+    def test_get_database_mapping_fetch_error_uses_stale_file(self, tmp_path):
+        """Test an expired mapping file is reused when meta_p is unreachable."""
+        with patch("src.services.db_mapping.OUTPUT_DIRS", {"sqlresults": tmp_path}):
+            output_file = tmp_path / "db_mapping.json"
+            output_file.write_text(json.dumps({"fr": "frwiki"}), encoding="utf-8")
+            os.utime(output_file, (0, 0))
+
+            with patch(
+                "src.services.db_mapping.fetch_database_mapping",
+                side_effect=pymysql.err.OperationalError("Connection failed"),
+            ):
+                get_database_mapping.cache_clear()
+
+                mapping = get_database_mapping()
+
+                assert mapping == {"fr": "frwiki", "en": "enwiki"}
+
+    def test_get_database_mapping_fetch_error_without_file(self, tmp_path):
+        """Test fetch errors propagate when no saved mapping exists."""
+        with patch("src.services.db_mapping.OUTPUT_DIRS", {"sqlresults": tmp_path}):
+            with patch(
+                "src.services.db_mapping.fetch_database_mapping",
+                side_effect=pymysql.err.OperationalError("Connection failed"),
+            ):
+                get_database_mapping.cache_clear()
+
+                with pytest.raises(pymysql.err.OperationalError, match="Connection failed"):
+                    get_database_mapping()
+
+    def test_get_database_mapping_unexpected_error_not_masked(self, tmp_path):
+        """Test errors other than connection failures are not hidden by the saved file."""
+        with patch("src.services.db_mapping.OUTPUT_DIRS", {"sqlresults": tmp_path}):
+            output_file = tmp_path / "db_mapping.json"
+            output_file.write_text(json.dumps({"fr": "frwiki"}), encoding="utf-8")
+            os.utime(output_file, (0, 0))
+
+            with patch("src.services.db_mapping.fetch_database_mapping", side_effect=TypeError("bad row")):
+                get_database_mapping.cache_clear()
+
+                with pytest.raises(TypeError, match="bad row"):
+                    get_database_mapping()
+
     def test_get_database_name_for_language_predefined(self):
         """Test get_database_name_for_language with predefined mapping."""
         # Clear cache first
@@ -131,6 +131,25 @@ class TestEditorProcessor:
         with pytest.raises(Exception, match="Query failed"):
             processor.process_language_patch("fr", ["Title1"], "2024")
 
+    @patch("src.services.processor.DatabaseAnalytics")
+    def test_process_language_patch_merges_batches(self, mock_db_class):
+        """Test process_language_patch sums editor counts across batches."""
+        mock_db = MagicMock()
+        mock_db.__enter__ = Mock(return_value=mock_db)
+        mock_db.__exit__ = Mock(return_value=False)
+        mock_db.execute.side_effect = [
+            [{"actor_name": "Editor1", "count": 10}, {"actor_name": "Editor2", "count": 5}],
+            [{"actor_name": "Editor1", "count": 3}],
+        ]
+        mock_db_class.return_value = mock_db
+
+        processor = EditorProcessor()
+        editors = processor.process_language_patch("fr", ["Title1", "Title2"], "2024", batch_size=1)
+
+        assert editors == {"Editor1": 13, "Editor2": 5}
+        assert type(editors) is dict
+        assert all(call.kwargs["stream"] is True for call in mock_db.execute.call_args_list)
+
     @patch("src.services.processor.DatabaseAnalytics")
     def test_process_language_ar_en_branch(self, mock_db_class):
         """Test process_language routes to ar_en for ar/en languages."""
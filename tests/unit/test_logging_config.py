@@ -1,10 +1,18 @@
 """Test logging configuration."""
 
 import logging
+import logging.handlers
+import time
 
 import pytest
 
-from src.logging_config import get_logger, setup_logging
+from src.logging_config import (
+    TimedMemoryHandler,
+    get_logger,
+    prepare_log_file,
+    setup_logging,
+    stop_logging,
+)
 
 
 @pytest.mark.unit
@@ -43,9 +51,92 @@ def test_all_log_levels(capsys):
     logger.info("Info message")
     logger.warning("Warning message")
     logger.error("Error message")
+    stop_logging()
 
     captured = capsys.readouterr()
     assert "Debug message" in captured.out
     assert "Info message" in captured.out
     assert "Warning message" in captured.out
     assert "Error message" in captured.out
+
+
+@pytest.mark.unit
+def test_setup_logging_replaces_previous_handler():
+    """Test repeated setup does not stack queue handlers."""
+    setup_logging()
+    setup_logging(level="DEBUG")
+
+    root_logger = logging.getLogger()
+    queue_handlers = [h for h in root_logger.handlers if isinstance(h, logging.handlers.QueueHandler)]
+    assert len(queue_handlers) == 1
+
+    stop_logging()
+    assert not any(isinstance(h, logging.handlers.QueueHandler) for h in root_logger.handlers)
+
+
+@pytest.mark.unit
+def test_setup_logging_file_output(tmp_path):
+    """Test buffered file output is flushed on shutdown."""
+    log_file = tmp_path / "app.log"
+    setup_logging(level="INFO", log_file=str(log_file))
+    logger = get_logger("test_file")
+
+    logger.info("File message")
+    stop_logging()
+
+    content = log_file.read_text(encoding="utf-8")
+    assert "File message" in content
+
+
+@pytest.mark.unit
+def test_timed_memory_handler_flushes_periodically():
+    """Test a partial buffer reaches the target without waiting for capacity."""
+    target = logging.handlers.BufferingHandler(capacity=100)
+    handler = TimedMemoryHandler(capacity=100, flush_interval=0.01, target=target)
+    try:
+        handler.handle(logging.makeLogRecord({"msg": "Buffered message", "levelno": logging.INFO}))
+
+        deadline = time.monotonic() + 2
+        while not target.buffer and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert [record.getMessage() for record in target.buffer] == ["Buffered message"]
+    finally:
+        handler.close()
+
+
+@pytest.mark.unit
+def test_setup_logging_keeps_caller_info(caplog):
+    """Test other handlers still see the caller's file and line."""
+    setup_logging()
+    get_logger("test_caller").warning("Caller message")
+    stop_logging()
+
+    record = caplog.records[-1]
+    assert record.filename == "test_logging_config.py"
+    assert record.lineno > 0
+
+
+@pytest.mark.unit
+def test_get_logger_cached():
+    """Test repeated lookups return the same logger instance."""
+    assert get_logger("test_cached") is get_logger("test_cached")
+
+
+@pytest.mark.unit
+def test_third_party_loggers_silenced():
+    """Test noisy third-party loggers are limited to WARNING."""
+    assert logging.getLogger("urllib3").level == logging.WARNING
+    assert logging.getLogger("pymysql").level == logging.WARNING
+
+
+@pytest.mark.unit
+def test_prepare_log_file_creates_parent(tmp_path):
+    """Test the log directory is created and the path returned."""
+    log_file = tmp_path / "logs" / "nested" / "app.log"
+
+    result = prepare_log_file(str(log_file))
+
+    assert result == log_file
+    assert log_file.parent.is_dir()
+    assert prepare_log_file(str(log_file)) == log_file
@@ -1,188 +1,153 @@
 """Unit tests for main module."""
 
 import sys
-from unittest.mock import MagicMock, Mock, patch
+from types import SimpleNamespace
 
 import pytest
 
+from src.config import LAST_YEAR
 from src.main import main, parse_arguments
 
 
+@pytest.fixture
+def argv(monkeypatch):
+    """Set sys.argv for code that parses the real command line."""
+
+    def _set(values):
+        monkeypatch.setattr(sys, "argv", values)
+
+    return _set
+
+
+@pytest.fixture
+def default_args():
+    """Parsed-arguments stand-in with the CLI defaults."""
+    return SimpleNamespace(
+        year="2024",
+        log_level="INFO",
+        log_file=None,
+        languages=None,
+        skip_steps=[],
+        desc=False,
+        skip_existing=False,
+    )
+
+
 @pytest.mark.unit
 class TestParseArguments:
     """Test argument parsing."""
 
-    def test_parse_arguments_defaults(self):
-        """Test parsing with default arguments."""
-        with patch.object(sys, "argv", ["start.py"]):
-            args = parse_arguments()
-            assert args.year  # Has default value
-            assert args.log_level == "INFO"
-            assert args.log_file is None
-            assert args.languages is None
-            assert args.skip_steps == []
-            assert args.desc is False
-            assert args.skip_existing is False
-
-    def test_parse_arguments_with_year(self):
-        """Test parsing with year argument."""
-        with patch.object(sys, "argv", ["start.py", "--year", "2023"]):
-            args = parse_arguments()
-            assert args.year == "2023"
-
-    def test_parse_arguments_with_log_level(self):
-        """Test parsing with log level argument."""
-        with patch.object(sys, "argv", ["start.py", "--log-level", "DEBUG"]):
-            args = parse_arguments()
-            assert args.log_level == "DEBUG"
-
-    def test_parse_arguments_with_log_file(self):
-        """Test parsing with log file argument."""
-        with patch.object(sys, "argv", ["start.py", "--log-file", "output.log"]):
-            args = parse_arguments()
-            assert args.log_file == "output.log"
-
-    def test_parse_arguments_with_languages(self):
-        """Test parsing with specific languages."""
-        with patch.object(sys, "argv", ["start.py", "--languages", "en", "fr", "de"]):
-            args = parse_arguments()
-            assert args.languages == ["en", "fr", "de"]
-
-    def test_parse_arguments_with_skip_steps(self):
-        """Test parsing with skip steps argument."""
-        with patch.object(sys, "argv", ["start.py", "--skip-steps", "1", "3"]):
-            args = parse_arguments()
-            assert args.skip_steps == [1, 3]
-
-    def test_parse_arguments_with_desc(self):
-        """Test parsing with descending sort flag."""
-        with patch.object(sys, "argv", ["start.py", "--desc"]):
-            args = parse_arguments()
-            assert args.desc is True
-
-    def test_parse_arguments_with_skip_existing(self):
-        """Test parsing with skip existing flag."""
-        with patch.object(sys, "argv", ["start.py", "--skip-existing"]):
-            args = parse_arguments()
-            assert args.skip_existing is True
+    @pytest.mark.parametrize(
+        "args_list,checks",
+        [
+            (
+                [],
+                {
+                    "year": LAST_YEAR,
+                    "log_level": "INFO",
+                    "log_file": None,
+                    "languages": None,
+                    "skip_steps": [],
+                    "desc": False,
+                    "skip_existing": False,
+                },
+            ),
+            (["--year", "2023"], {"year": "2023"}),
+            (["--log-level", "DEBUG"], {"log_level": "DEBUG"}),
+            (["--log-file", "output.log"], {"log_file": "output.log"}),
+            (["--languages", "en", "fr", "de"], {"languages": ["en", "fr", "de"]}),
+            (["--skip-steps", "1", "3"], {"skip_steps": [1, 3]}),
+            (["--desc"], {"desc": True}),
+            (["--skip-existing"], {"skip_existing": True}),
+        ],
+        ids=["defaults", "year", "log_level", "log_file", "languages", "skip_steps", "desc", "skip_existing"],
+    )
+    def test_parse_arguments(self, args_list, checks):
+        """Test parsing each command-line option."""
+        args = parse_arguments(args_list)
+        for name, expected in checks.items():
+            assert getattr(args, name) == expected
+
+    def test_parse_arguments_reads_sys_argv(self, argv):
+        """Test parsing falls back to sys.argv."""
+        argv(["start.py", "--year", "2023"])
+        args = parse_arguments()
+        assert args.year == "2023"
 
 
 @pytest.mark.unit
 class TestMain:
     """Test main function."""
 
-    @patch("src.main.WorkflowOrchestrator")
-    @patch("src.main.parse_arguments")
-    @patch("src.main.setup_logging")
-    def test_main_success(self, mock_setup_logging, mock_parse_args, mock_orchestrator_class):
-        """Test main function with successful execution."""
-        # Setup mocks
-        mock_args = Mock()
-        mock_args.year = "2024"
-        mock_args.log_level = "INFO"
-        mock_args.log_file = None
-        mock_args.languages = None
-        mock_args.skip_steps = []
-        mock_args.desc = False
-        mock_args.skip_existing = False
-        mock_parse_args.return_value = mock_args
-
-        mock_orchestrator = Mock()
-        mock_orchestrator.run_complete_workflow.return_value = 0
-        mock_orchestrator_class.return_value = mock_orchestrator
-
-        # Run main
-        exit_code = main()
-
-        # Verify
-        assert exit_code == 0
-        mock_setup_logging.assert_called_once_with(level="INFO", log_file=None)
-        mock_orchestrator.run_complete_workflow.assert_called_once_with(
-            year="2024", languages=None, skip_steps=[], sort_desc=False, skip_existing=False
-        )
-
-    @patch("src.main.WorkflowOrchestrator")
-    @patch("src.main.parse_arguments")
-    @patch("src.main.setup_logging")
-    def test_main_with_arguments(self, mock_setup_logging, mock_parse_args, mock_orchestrator_class):
-        """Test main function with custom arguments."""
-        # Setup mocks
-        mock_args = Mock()
-        mock_args.year = "2023"
-        mock_args.log_level = "DEBUG"
-        mock_args.log_file = "debug.log"
-        mock_args.languages = ["en", "fr"]
-        mock_args.skip_steps = [2]
-        mock_args.desc = True
-        mock_args.skip_existing = True
-        mock_parse_args.return_value = mock_args
-
-        mock_orchestrator = Mock()
-        mock_orchestrator.run_complete_workflow.return_value = 1
-        mock_orchestrator_class.return_value = mock_orchestrator
-
-        # Run main
-        exit_code = main()
-
-        # Verify arguments passed through
-        mock_setup_logging.assert_called_once_with(level="DEBUG", log_file="debug.log")
-        mock_orchestrator.run_complete_workflow.assert_called_once_with(
-            year="2023", languages=["en", "fr"], skip_steps=[2], sort_desc=True, skip_existing=True
-        )
-        assert exit_code == 1
-
-    @patch("src.main.WorkflowOrchestrator")
-    @patch("src.main.parse_arguments")
-    @patch("src.main.setup_logging")
-    def test_main_with_skip_steps_logging(self, mock_setup_logging, mock_parse_args, mock_orchestrator_class):
-        """Test main function logs skip steps correctly."""
-        # Setup mocks
-        mock_args = Mock()
-        mock_args.year = "2024"
-        mock_args.log_level = "INFO"
-        mock_args.log_file = None
-        mock_args.languages = None
-        mock_args.skip_steps = [1, 3]
-        mock_args.desc = False
-        mock_args.skip_existing = False
-        mock_parse_args.return_value = mock_args
-
-        mock_orchestrator = Mock()
-        mock_orchestrator.run_complete_workflow.return_value = 0
-        mock_orchestrator_class.return_value = mock_orchestrator
-
-        # Run main
-        exit_code = main()
-
-        # Verify skip steps are passed
-        mock_orchestrator.run_complete_workflow.assert_called_once()
-        call_args = mock_orchestrator.run_complete_workflow.call_args[1]
-        assert call_args["skip_steps"] == [1, 3]
-
-    @patch("src.main.WorkflowOrchestrator")
-    @patch("src.main.parse_arguments")
-    @patch("src.main.setup_logging")
-    def test_main_with_languages_logging(self, mock_setup_logging, mock_parse_args, mock_orchestrator_class):
-        """Test main function logs languages correctly."""
-        # Setup mocks
-        mock_args = Mock()
-        mock_args.year = "2024"
-        mock_args.log_level = "INFO"
-        mock_args.log_file = None
-        mock_args.languages = ["en", "fr", "de"]
-        mock_args.skip_steps = []
-        mock_args.desc = False
-        mock_args.skip_existing = False
-        mock_parse_args.return_value = mock_args
-
-        mock_orchestrator = Mock()
-        mock_orchestrator.run_complete_workflow.return_value = 0
-        mock_orchestrator_class.return_value = mock_orchestrator
-
-        # Run main
-        exit_code = main()
-
-        # Verify languages are passed
-        mock_orchestrator.run_complete_workflow.assert_called_once()
-        call_args = mock_orchestrator.run_complete_workflow.call_args[1]
-        assert call_args["languages"] == ["en", "fr", "de"]
+    @pytest.fixture(autouse=True)
+    def mocks(self, mocker, default_args):
+        """Patch main's collaborators for every test in the class."""
+        orchestrator = mocker.patch("src.workflow.WorkflowOrchestrator").return_value
+        orchestrator.run_complete_workflow.return_value = 0
+
+        return {
+            "setup_logging": mocker.patch("src.main.setup_logging"),
+            "parse_arguments": mocker.patch("src.main.parse_arguments", return_value=default_args),
+            "orchestrator": orchestrator,
+        }
+
+    @pytest.mark.parametrize(
+        "overrides,expected_logging,expected_call,expected_exit",
+        [
+            (
+                {},
+                {"level": "INFO", "log_file": None},
+                {"year": "2024", "languages": None, "skip_steps": [], "sort_desc": False, "skip_existing": False},
+                0,
+            ),
+            (
+                {
+                    "year": "2023",
+                    "log_level": "DEBUG",
+                    "log_file": "debug.log",
+                    "languages": ["en", "fr"],
+                    "skip_steps": [2],
+                    "desc": True,
+                    "skip_existing": True,
+                },
+                {"level": "DEBUG", "log_file": "debug.log"},
+                {
+                    "year": "2023",
+                    "languages": ["en", "fr"],
+                    "skip_steps": [2],
+                    "sort_desc": True,
+                    "skip_existing": True,
+                },
+                1,
+            ),
+            (
+                {"skip_steps": [1, 3]},
+                {"level": "INFO", "log_file": None},
+                {"year": "2024", "languages": None, "skip_steps": [1, 3], "sort_desc": False, "skip_existing": False},
+                0,
+            ),
+            (
+                {"languages": ["en", "fr", "de"]},
+                {"level": "INFO", "log_file": None},
+                {
+                    "year": "2024",
+                    "languages": ["en", "fr", "de"],
+                    "skip_steps": [],
+                    "sort_desc": False,
+                    "skip_existing": False,
+                },
+                0,
+            ),
+        ],
+        ids=["defaults", "with_arguments", "skip_steps", "languages"],
+    )
+    def test_main(self, mocks, default_args, overrides, expected_logging, expected_call, expected_exit):
+        """Test main forwards parsed arguments and returns the workflow exit code."""
+        for name, value in overrides.items():
+            setattr(default_args, name, value)
+        mocks["orchestrator"].run_complete_workflow.return_value = expected_exit
+
+        assert main() == expected_exit
+
+        mocks["setup_logging"].assert_called_once_with(**expected_logging)
+        mocks["orchestrator"].run_complete_workflow.assert_called_once_with(**expected_call)
@@ -30,6 +30,8 @@ class TestUtils:
             ("Username123", False),
             ("2001:0db8:85a3:0000:0000:8a2e:0370:7334", True),
             ("NotAnIP", False),
+            ("~2025-16569-5", True),
+            ("cafe", False),
         ],
     )
     def test_is_ip_address(self, ip, expected):
@@ -0,0 +1 @@
+"""Workflow unit tests package."""
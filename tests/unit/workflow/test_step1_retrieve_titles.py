@@ -1,6 +1,6 @@
 """Unit tests for step1_retrieve_titles module."""
 
-from unittest.mock import MagicMock, patch
+import re
 
 import pytest
 
@@ -13,125 +13,117 @@ from src.workflow.step1_retrieve_titles import (
 )
 
 
-@pytest.mark.unit
-class TestOrganizeTitlesByLanguage:
-    """Test _organize_titles_by_language function."""
+@pytest.fixture(scope="module")
+def out_dir(tmp_path_factory):
+    """Shared output directory for the whole module."""
+    return tmp_path_factory.mktemp("step1_out")
 
-    def test_organize_titles_basic(self):
-        """Test basic title organization by language."""
-        results = [
-            {"page_title": "Medicine", "ll_lang": "fr", "ll_title": "Médecine"},
-            {"page_title": "Medicine", "ll_lang": "de", "ll_title": "Medizin"},
-            {"page_title": "Anatomy", "ll_lang": "fr", "ll_title": "Anatomie"},
-        ]
 
-        result = _organize_titles_by_language(results)
+@pytest.fixture(autouse=True)
+def output_dirs(monkeypatch, out_dir):
+    """Point every step 1 output directory at the shared out_dir.
 
-        assert "en" in result
-        assert "fr" in result
-        assert "de" in result
-        assert set(result["en"]) == {"Medicine", "Anatomy"}
-        assert result["fr"] == ["Médecine", "Anatomie"]
-        assert result["de"] == ["Medizin"]
-
-    def test_organize_titles_with_missing_lang(self):
-        """Test handling rows with missing language."""
-        results = [
-            {"page_title": "Medicine", "ll_lang": "", "ll_title": "Médecine"},
-            {"page_title": "Anatomy", "ll_title": "Anatomie"},
-        ]
-
-        result = _organize_titles_by_language(results)
+    Tests that write a fixed filename and assert on its existence should
+    override the relevant entry with their own tmp_path.
+    """
+    dirs = {"reports": out_dir, "languages": out_dir, "sqlresults": out_dir}
+    monkeypatch.setattr("src.workflow.step1_retrieve_titles.OUTPUT_DIRS", dirs)
+    return dirs
 
-        # Should only have English titles from page_title
-        assert "en" in result
-        assert set(result["en"]) == {"Medicine", "Anatomy"}
-        # Other languages should not be created for missing lang/title
-        assert "fr" not in result
 
-    def test_organize_titles_empty_results(self):
-        """Test handling empty results."""
-        result = _organize_titles_by_language([])
+BASIC_RESULTS = [
+    {"page_title": "Medicine", "ll_lang": "fr", "ll_title": "Médecine"},
+    {"page_title": "Medicine", "ll_lang": "de", "ll_title": "Medizin"},
+    {"page_title": "Anatomy", "ll_lang": "fr", "ll_title": "Anatomie"},
+]
 
-        assert result == {"en": []}
+MISSING_LANG_RESULTS = [
+    {"page_title": "Medicine", "ll_lang": "", "ll_title": "Médecine"},
+    {"page_title": "Anatomy", "ll_title": "Anatomie"},
+]
 
-    def test_organize_titles_duplicates(self):
-        """Test handling duplicate language entries."""
-        results = [
-            {"page_title": "Medicine", "ll_lang": "fr", "ll_title": "Médecine"},
-            {"page_title": "Medicine", "ll_lang": "fr", "ll_title": "Médecine"},
-            {"page_title": "Medicine", "ll_lang": "fr", "ll_title": "Médecine"},
-        ]
+DUPLICATE_RESULTS = [
+    {"page_title": "Medicine", "ll_lang": "fr", "ll_title": "Médecine"},
+    {"page_title": "Medicine", "ll_lang": "fr", "ll_title": "Médecine"},
+    {"page_title": "Medicine", "ll_lang": "fr", "ll_title": "Médecine"},
+]
 
-        result = _organize_titles_by_language(results)
+MULTIPLE_PAGE_RESULTS = [
+    {"page_title": "Medicine", "ll_lang": "fr", "ll_title": "Médecine"},
+    {"page_title": "Anatomy", "ll_lang": "fr", "ll_title": "Anatomie"},
+    {"page_title": "Physiology", "ll_lang": "fr", "ll_title": "Physiologie"},
+]
 
-        # Duplicates should be preserved (as the function uses list append)
-        assert result["fr"] == ["Médecine", "Médecine", "Médecine"]
 
-    def test_organize_titles_multiple_page_titles(self):
-        """Test with multiple different page titles."""
-        results = [
-            {"page_title": "Medicine", "ll_lang": "fr", "ll_title": "Médecine"},
-            {"page_title": "Anatomy", "ll_lang": "fr", "ll_title": "Anatomie"},
-            {"page_title": "Physiology", "ll_lang": "fr", "ll_title": "Physiologie"},
-        ]
+@pytest.mark.unit
+class TestOrganizeTitlesByLanguage:
+    """Test _organize_titles_by_language function."""
 
+    @pytest.mark.parametrize(
+        "results,expected_en,expected_other",
+        [
+            (BASIC_RESULTS, {"Medicine", "Anatomy"}, {"fr": ["Médecine", "Anatomie"], "de": ["Medizin"]}),
+            # Rows without a language only contribute English titles
+            (MISSING_LANG_RESULTS, {"Medicine", "Anatomy"}, {}),
+            ([], set(), {}),
+            # Duplicates are preserved for linked languages
+            (DUPLICATE_RESULTS, {"Medicine"}, {"fr": ["Médecine", "Médecine", "Médecine"]}),
+            (
+                MULTIPLE_PAGE_RESULTS,
+                {"Medicine", "Anatomy", "Physiology"},
+                {"fr": ["Médecine", "Anatomie", "Physiologie"]},
+            ),
+        ],
+        ids=["basic", "missing_lang", "empty", "duplicates", "multiple_page_titles"],
+    )
+    def test_organize_titles(self, results, expected_en, expected_other):
+        """Test title organization by language."""
         result = _organize_titles_by_language(results)
 
-        assert set(result["en"]) == {"Medicine", "Anatomy", "Physiology"}
+        assert set(result.pop("en")) == expected_en
+        assert result == expected_other
+
+
+@pytest.fixture(scope="module")
+def summary_content(tmp_path_factory):
+    """Write the language summary report once and return its text."""
+    reports_dir = tmp_path_factory.mktemp("summary")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("src.workflow.step1_retrieve_titles.OUTPUT_DIRS", {"reports": reports_dir})
+        _save_language_summary_report(
+            {
+                "en": ["a", "b", "c"],  # 3 titles
+                "fr": ["x", "y"],  # 2 titles
+                "de": ["z"],  # 1 title
+            }
+        )
+    return (reports_dir / "language_titles_summary.wiki").read_text(encoding="utf-8")
 
 
 @pytest.mark.unit
 class TestSaveLanguageSummaryReport:
     """Test _save_language_summary_report function."""
 
-    def test_save_summary_report(self, tmp_path):
-        """Test saving language summary report."""
-        titles_by_language = {
-            "en": ["Medicine", "Anatomy"],
-            "fr": ["Médecine", "Anatomie"],
-            "de": ["Medizin"],
-        }
-
-        with patch("src.workflow.step1_retrieve_titles.OUTPUT_DIRS", {"reports": tmp_path}):
-            _save_language_summary_report(titles_by_language)
+    def test_save_summary_report(self, summary_content):
+        """Test the report contains the header and one row per language."""
+        assert summary_content.startswith("Language Titles Summary:\n")
+        assert "| [https://en.wikipedia.org/wiki/ en] || 3" in summary_content
+        assert "| [https://fr.wikipedia.org/wiki/ fr] || 2" in summary_content
+        assert "| [https://de.wikipedia.org/wiki/ de] || 1" in summary_content
+        assert summary_content.endswith("|}\n")
 
-            output_file = tmp_path / "language_titles_summary.wiki"
-            assert output_file.exists()
-
-            content = output_file.read_text(encoding="utf-8")
-            assert "Language Titles Summary:" in content
-            assert "| [https://en.wikipedia.org/wiki/ en] || 2" in content
-            assert "| [https://fr.wikipedia.org/wiki/ fr] || 2" in content
-            assert "| [https://de.wikipedia.org/wiki/ de] || 1" in content
-
-    def test_save_summary_report_sorting(self, tmp_path):
+    def test_save_summary_report_sorting(self, summary_content):
         """Test that report is sorted by count descending."""
-        titles_by_language = {
-            "en": ["a", "b", "c"],  # 3 titles
-            "fr": ["x", "y"],  # 2 titles
-            "de": ["z"],  # 1 title
-        }
-
-        with patch("src.workflow.step1_retrieve_titles.OUTPUT_DIRS", {"reports": tmp_path}):
-            _save_language_summary_report(titles_by_language)
-
-            output_file = tmp_path / "language_titles_summary.wiki"
-            content = output_file.read_text(encoding="utf-8")
-
-            # Check order: en (3), fr (2), de (1)
-            en_pos = content.index("|| 3")
-            fr_pos = content.index("|| 2")
-            de_pos = content.index("|| 1")
-
-            assert en_pos < fr_pos < de_pos
+        # Row counts must appear in descending order: en (3), fr (2), de (1)
+        counts = [int(m) for m in re.findall(r"\|\| (\d+)", summary_content)]
+        assert counts == [3, 2, 1]
 
 
 @pytest.mark.unit
 class TestSaveLanguageFiles:
     """Test _save_language_files function."""
 
-    def test_save_language_files(self, mocker, tmp_path):
+    def test_save_language_files(self, mocker, out_dir):
         """Test saving language files."""
         titles_by_language = {
             "en": ["Medicine", "Anatomy"],
@@ -139,93 +131,74 @@ class TestSaveLanguageFiles:
         }
 
         mock_save = mocker.patch("src.workflow.step1_retrieve_titles.save_language_titles")
-        with patch("src.workflow.step1_retrieve_titles.OUTPUT_DIRS", {"languages": tmp_path}):
-            _save_language_files(titles_by_language)
+        _save_language_files(titles_by_language)
 
-            # Verify save_language_titles was called for each language
-            assert mock_save.call_count == 2
-            mock_save.assert_any_call("en", ["Medicine", "Anatomy"], tmp_path)
-            mock_save.assert_any_call("fr", ["Médecine"], tmp_path)
+        # Verify save_language_titles was called once per language, in any order
+        assert mock_save.call_count == 2
+        calls = {(c.args[0], tuple(c.args[1]), c.args[2]) for c in mock_save.call_args_list}
+        assert calls == {("en", ("Medicine", "Anatomy"), out_dir), ("fr", ("Médecine",), out_dir)}
 
-    def test_save_language_files_empty(self, mocker, tmp_path):
+    def test_save_language_files_empty(self, mocker):
         """Test saving empty language list."""
         titles_by_language = {}
 
         mock_save = mocker.patch("src.workflow.step1_retrieve_titles.save_language_titles")
-        with patch("src.workflow.step1_retrieve_titles.OUTPUT_DIRS", {"languages": tmp_path}):
-            _save_language_files(titles_by_language)
+        _save_language_files(titles_by_language)
 
-            # Should not be called for empty dict
-            mock_save.assert_not_called()
+        # Should not be called for empty dict
+        mock_save.assert_not_called()
 
 
 @pytest.mark.unit
 class TestFetchMedicineTitles:
     """Test fetch_medicine_titles function."""
 
-    def test_fetch_medicine_titles_success(self, mocker, tmp_path):
+    def test_fetch_medicine_titles_success(self, mocker):
         """Test successful fetch of medicine titles."""
         mock_results = [
             {"page_title": "Medicine", "ll_lang": "fr", "ll_title": "Médecine"},
             {"page_title": "Anatomy", "ll_lang": "de", "ll_title": "Anatomie"},
         ]
 
-        # Mock DatabaseAnalytics context manager
-        mock_db = MagicMock()
-        mock_db.execute.return_value = mock_results
-
-        mock_db_context = mocker.Mock()
-        mock_db_context.__enter__ = mocker.Mock(return_value=mock_db)
-        mock_db_context.__exit__ = mocker.Mock(return_value=None)
-
-        mocker.patch("src.workflow.step1_retrieve_titles.DatabaseAnalytics", return_value=mock_db_context)
+        # MagicMock already supports the context manager protocol
+        mock_db_class = mocker.patch("src.workflow.step1_retrieve_titles.DatabaseAnalytics")
+        mock_db_class.return_value.__enter__.return_value.execute.return_value = mock_results
         mocker.patch("src.workflow.step1_retrieve_titles.save_titles_sql_results")
-        with patch("src.workflow.step1_retrieve_titles.OUTPUT_DIRS", {"sqlresults": tmp_path}):
-            result = fetch_medicine_titles()
+        result = fetch_medicine_titles()
 
-            assert len(result) == 2
-            assert result == mock_results
+        assert len(result) == 2
+        assert result == mock_results
 
     def test_fetch_medicine_titles_database_error(self, mocker):
         """Test fetch with database error."""
         # Mock DatabaseAnalytics to raise exception
-        mock_db_context = mocker.Mock()
-        mock_db_context.__enter__ = mocker.Mock(side_effect=Exception("Connection failed"))
-        mock_db_context.__exit__ = mocker.Mock(return_value=None)
-
-        mocker.patch("src.workflow.step1_retrieve_titles.DatabaseAnalytics", return_value=mock_db_context)
+        mock_db_class = mocker.patch("src.workflow.step1_retrieve_titles.DatabaseAnalytics")
+        mock_db_class.return_value.__enter__.side_effect = Exception("Connection failed")
 
         result = fetch_medicine_titles()
 
         # Should return empty list on error
         assert result == []
 
-    def test_fetch_medicine_titles_empty_results(self, mocker, tmp_path):
+    def test_fetch_medicine_titles_empty_results(self, mocker):
         """Test fetch with no results."""
         # Mock DatabaseAnalytics with empty results
-        mock_db = MagicMock()
-        mock_db.execute.return_value = []
-
-        mock_db_context = mocker.Mock()
-        mock_db_context.__enter__ = mocker.Mock(return_value=mock_db)
-        mock_db_context.__exit__ = mocker.Mock(return_value=None)
-
-        mocker.patch("src.workflow.step1_retrieve_titles.DatabaseAnalytics", return_value=mock_db_context)
+        mock_db_class = mocker.patch("src.workflow.step1_retrieve_titles.DatabaseAnalytics")
+        mock_db_class.return_value.__enter__.return_value.execute.return_value = []
 
         # save_titles_sql_results should not be called for empty results
         mock_save = mocker.patch("src.workflow.step1_retrieve_titles.save_titles_sql_results")
-        with patch("src.workflow.step1_retrieve_titles.OUTPUT_DIRS", {"sqlresults": tmp_path}):
-            result = fetch_medicine_titles()
+        result = fetch_medicine_titles()
 
-            assert result == []
-            mock_save.assert_not_called()
+        assert result == []
+        mock_save.assert_not_called()
 
 
 @pytest.mark.unit
 class TestDownloadMedicineTitles:
     """Test download_medicine_titles function."""
 
-    def test_download_medicine_titles_full_flow(self, mocker, tmp_path):
+    def test_download_medicine_titles_full_flow(self, mocker):
         """Test complete download workflow."""
         mock_results = [
             {"page_title": "Medicine", "ll_lang": "fr", "ll_title": "Médecine"},
@@ -240,20 +213,19 @@ class TestDownloadMedicineTitles:
         mock_save_files = mocker.patch("src.workflow.step1_retrieve_titles._save_language_files")
         mock_save_report = mocker.patch("src.workflow.step1_retrieve_titles._save_language_summary_report")
 
-        with patch("src.workflow.step1_retrieve_titles.OUTPUT_DIRS", {"reports": tmp_path, "languages": tmp_path}):
-            download_medicine_titles()
+        download_medicine_titles()
 
-            # Verify _save_language_files was called
-            mock_save_files.assert_called_once()
-            titles_arg = mock_save_files.call_args[0][0]
-            assert "en" in titles_arg
-            assert "fr" in titles_arg
-            assert "de" in titles_arg
+        # Verify _save_language_files was called
+        mock_save_files.assert_called_once()
+        titles_arg = mock_save_files.call_args[0][0]
+        assert "en" in titles_arg
+        assert "fr" in titles_arg
+        assert "de" in titles_arg
 
-            # Verify _save_language_summary_report was called
-            mock_save_report.assert_called_once()
+        # Verify _save_language_summary_report was called
+        mock_save_report.assert_called_once()
 
-    def test_download_medicine_titles_empty_results(self, mocker, tmp_path):
+    def test_download_medicine_titles_empty_results(self, mocker):
         """Test download with empty results."""
         # Mock fetch_medicine_titles to return empty list
         mocker.patch("src.workflow.step1_retrieve_titles.fetch_medicine_titles", return_value=[])
@@ -261,9 +233,8 @@ class TestDownloadMedicineTitles:
         mock_save_files = mocker.patch("src.workflow.step1_retrieve_titles._save_language_files")
         mock_save_report = mocker.patch("src.workflow.step1_retrieve_titles._save_language_summary_report")
 
-        with patch("src.workflow.step1_retrieve_titles.OUTPUT_DIRS", {"reports": tmp_path, "languages": tmp_path}):
-            download_medicine_titles()
+        download_medicine_titles()
 
-            # Should still call save functions with empty dict
-            mock_save_files.assert_called_once_with({"en": []})
-            mock_save_report.assert_called_once_with({"en": []})
+        # Should still call save functions with empty dict
+        mock_save_files.assert_called_once_with({"en": []})
+        mock_save_report.assert_called_once_with({"en": []})
@@ -1,11 +1,16 @@
 """Unit tests for step2_process_languages module."""
 
-from unittest.mock import patch
+import logging
+import threading
+import time
+from concurrent.futures import wait
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from src.workflow.step2_process_languages import (
     _get_languages_to_process,
+    _process_language_task,
     _process_single_language,
     _process_titles_for_language,
     gather_language_titles,
@@ -111,6 +116,20 @@ class TestProcessSingleLanguage:
         mock_report_gen.save_editors_json.assert_not_called()
         mock_report_gen.generate_language_report.assert_not_called()
 
+    def test_process_language_task_banner(self, mocker, caplog):
+        """Test the per-language banner groups the title count with thousands separators."""
+        caplog.set_level(logging.INFO, logger="src.workflow.step2_process_languages")
+        mock_single = mocker.patch(
+            "src.workflow.step2_process_languages._process_single_language", return_value={"Editor1": 1}
+        )
+        titles = ["Medicine"] * 1234
+
+        result = _process_language_task("fr", "2024", 100, titles, position=3, total=10)
+
+        assert result == {"Editor1": 1}
+        mock_single.assert_called_once_with("fr", "2024", 100, titles, cancel_event=None)
+        assert "Language 3/10: fr, titles: 1,234" in caplog.messages
+
 
 @pytest.mark.unit
 class TestGatherLanguageTitles:
@@ -292,3 +311,113 @@ class TestProcessLanguages:
             # Verify ordering by title count: fr (3), de (2), en (1)
             keys = list(result.keys())
             assert keys == ["fr", "de", "en"]
+
+    def test_process_languages_propagates_errors(self, mocker, tmp_path):
+        """Test that a failing language aborts processing."""
+        mocker.patch("src.workflow.step2_process_languages.get_available_languages", return_value=["en", "fr"])
+
+        mocker.patch("src.workflow.step2_process_languages.load_language_titles_safe", return_value=["Medicine"])
+
+        mocker.patch(
+            "src.workflow.step2_process_languages._process_titles_for_language",
+            side_effect=RuntimeError("Query failed"),
+        )
+
+        mock_report_gen = mocker.Mock()
+        mock_report_gen.load_editors_json.return_value = None
+        mocker.patch("src.workflow.step2_process_languages.ReportGenerator", return_value=mock_report_gen)
+
+        with patch("src.workflow.step2_process_languages.OUTPUT_DIRS", {"languages": tmp_path, "reports": tmp_path}):
+            with pytest.raises(RuntimeError, match="Query failed"):
+                process_languages("2024")
+
+    def test_process_languages_fails_fast(self, mocker, tmp_path):
+        """Test a failure cancels queued languages without waiting on a slower earlier one."""
+        languages = ["slow", "bad"] + [f"l{i}" for i in range(10)]
+        mocker.patch("src.workflow.step2_process_languages.get_available_languages", return_value=languages)
+        mocker.patch("src.workflow.step2_process_languages.load_language_titles_safe", return_value=["Medicine"])
+        mocker.patch("src.workflow.step2_process_languages.MAX_CONNECTIONS", 2)
+
+        # "slow" only finishes once process_languages has seen the failure
+        failure_seen = threading.Event()
+        processed = []
+
+        def mock_process(lang, *_, **__):
+            if lang == "slow":
+                failure_seen.wait(timeout=5)
+            elif lang == "bad":
+                raise RuntimeError("Query failed")
+            else:
+                time.sleep(0.05)
+            processed.append(lang)
+            return {lang: 1}
+
+        def wait_and_signal(*args, **kwargs):
+            result = wait(*args, **kwargs)
+            failure_seen.set()
+            return result
+
+        mocker.patch("src.workflow.step2_process_languages._process_titles_for_language", side_effect=mock_process)
+        mocker.patch("src.workflow.step2_process_languages.wait", side_effect=wait_and_signal)
+
+        mock_report_gen = mocker.Mock()
+        mock_report_gen.load_editors_json.return_value = None
+        mocker.patch("src.workflow.step2_process_languages.ReportGenerator", return_value=mock_report_gen)
+
+        with patch("src.workflow.step2_process_languages.OUTPUT_DIRS", {"languages": tmp_path, "reports": tmp_path}):
+            with pytest.raises(RuntimeError, match="Query failed"):
+                process_languages("2024")
+
+        assert "slow" in processed
+        assert "l9" not in processed
+        assert len(processed) < len(languages) - 1
+
+    def test_process_languages_stops_running_language(self, mocker, tmp_path):
+        """Test a failure stops a language that is mid-way through its batches."""
+        mocker.patch("src.workflow.step2_process_languages.get_available_languages", return_value=["slow", "bad"])
+        mocker.patch(
+            "src.workflow.step2_process_languages.load_language_titles_safe",
+            side_effect=lambda lang, _: [f"Title{i}" for i in range(30)] if lang == "slow" else ["Medicine"],
+        )
+        mocker.patch("src.workflow.step2_process_languages.MAX_CONNECTIONS", 2)
+
+        slow_started = threading.Event()
+        slow_batches = []
+
+        def make_db(lang, *_, **__):
+            db = MagicMock()
+            if lang == "slow":
+
+                def execute(*_, **__):
+                    slow_batches.append(1)
+                    slow_started.set()
+                    time.sleep(0.1)
+                    return []
+
+            else:
+
+                def execute(*_, **__):
+                    slow_started.wait(timeout=5)
+                    raise RuntimeError("Query failed")
+
+            db.execute.side_effect = execute
+            context = MagicMock()
+            context.__enter__.return_value = db
+            return context
+
+        mocker.patch("src.services.processor.DatabaseAnalytics", side_effect=make_db)
+
+        mock_report_gen = mocker.Mock()
+        mock_report_gen.load_editors_json.return_value = None
+        mocker.patch("src.workflow.step2_process_languages.ReportGenerator", return_value=mock_report_gen)
+
+        start = time.monotonic()
+        with patch("src.workflow.step2_process_languages.OUTPUT_DIRS", {"languages": tmp_path, "reports": tmp_path}):
+            with pytest.raises(RuntimeError, match="Query failed"):
+                process_languages("2024", batch_size=1)
+        elapsed = time.monotonic() - start
+
+        # 30 batches of 0.1s would take 3s; "slow" stops at its next batch boundary
+        assert elapsed < 1.5
+        assert len(slow_batches) < 30
+        mock_report_gen.save_editors_json.assert_not_called()
@@ -23,8 +23,8 @@ class TestWorkflowOrchestrator:
         # Mock database
         mock_db = MagicMock()
         mock_db.execute.return_value = [
-            {"lang": "ar", "dbname": "arwiki"},
-            {"lang": "fr", "dbname": "frwiki"},
+            ("ar", "arwiki", None),
+            ("fr", "frwiki", None),
         ]
 
         mock_db_context = mocker.Mock()